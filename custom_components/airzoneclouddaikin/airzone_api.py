@@ -57,6 +57,8 @@ _LOGGER = logging.getLogger(__name__)
 _MAX_RETRIES = 3
 _BASE_DELAY = 0.6
 _JITTER = 0.25
+# Immutable; shared by every request instead of being rebuilt per call
+_CLIENT_TIMEOUT = ClientTimeout(total=REQUEST_TIMEOUT)
 
 
 class AirzoneAPI:
@@ -150,12 +152,16 @@ class AirzoneAPI:
         if extra_headers:
             headers.update(extra_headers)
 
-        timeout = ClientTimeout(total=REQUEST_TIMEOUT)
         spath = self._safe_path(path)
 
         try:
             async with self._session.request(
-                method, url, params=params, json=json, headers=headers, timeout=timeout
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=headers,
+                timeout=_CLIENT_TIMEOUT,
             ) as resp:
                 resp.raise_for_status()
                 empty_body = resp.status == 204 or resp.content_length == 0
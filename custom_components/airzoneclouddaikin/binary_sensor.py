@@ -65,6 +65,7 @@ class AirzoneDeviceOnBinarySensor(
         self._device_id = device_id
         self._attr_name = "Device On"
         self._attr_unique_id = f"{device_id}_device_on"
+        self._attr_device_info = self._build_device_info(self._device)
 
     @property
     def _device(self) -> dict[str, Any]:
@@ -96,10 +97,8 @@ class AirzoneDeviceOnBinarySensor(
         """Available when we have a device snapshot."""
         return bool(self._device)
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self, dev: dict[str, Any]) -> DeviceInfo:
         """Return Device Registry metadata (connections via DeviceInfo)."""
-        dev = self._device
         mac = (str(dev.get("mac") or "").strip()) or None
         connections = {(CONNECTION_NETWORK_MAC, mac)} if mac else None
 
@@ -131,6 +130,7 @@ class AirzoneWServerOnlineBinarySensor(
         self._stale_after_sec = int(INTERNAL_STALE_AFTER_SEC)
         self._attr_name = "WServer Online"
         self._attr_unique_id = f"{device_id}_wserver_online"
+        self._attr_device_info = self._build_device_info(self._device)
 
     @property
     def _device(self) -> dict[str, Any]:
@@ -176,10 +176,8 @@ class AirzoneWServerOnlineBinarySensor(
             "seconds_since_connection": age,
         }
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self, dev: dict[str, Any]) -> DeviceInfo:
         """Return Device Registry metadata (connections via DeviceInfo)."""
-        dev = self._device
         mac = (str(dev.get("mac") or "").strip()) or None
         connections = {(CONNECTION_NETWORK_MAC, mac)} if mac else None
 
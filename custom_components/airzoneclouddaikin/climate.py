@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.climate import ClimateEntity
@@ -18,11 +20,13 @@ from .const import (
     CONF_ENABLE_HEAT_COOL,
     DOMAIN,
     MANUFACTURER,
+    SCENARY_HOME,
+    SCENARY_SLEEP,
+    SCENARY_VACANT,
 )
 from .helpers import (
     acquire_device_lock,
     async_auto_exit_sleep_if_needed,
-    bitmask_supports_p2,
     clamp_temperature,
     optimistic_get,
     optimistic_invalidate,
@@ -57,6 +61,94 @@ HVAC_TO_MODE: dict[HVACMode, str] = {
     HVACMode.DRY: "5",
 }
 
+# HA preset <-> backend scenary.
+_PRESET_TO_SCENARY: dict[str, str] = {
+    "home": SCENARY_HOME,
+    "away": SCENARY_VACANT,
+    "sleep": SCENARY_SLEEP,
+}
+_SCENARY_TO_PRESET: dict[str, str] = {v: k for k, v in _PRESET_TO_SCENARY.items()}
+# Frozen preset order; preset_modes hands out a per-entity copy.
+_PRESET_MODES: tuple[str, ...] = tuple(_PRESET_TO_SCENARY)
+
+# Bitmask-driven HVAC modes in display order, with the P2 codes enabling each.
+_BITMASK_HVAC_MODES: tuple[tuple[HVACMode, tuple[int, ...]], ...] = (
+    (HVACMode.COOL, (1,)),
+    (HVACMode.HEAT, (2,)),
+    (HVACMode.FAN_ONLY, (3, 8)),
+    (HVACMode.HEAT_COOL, (4,)),
+    (HVACMode.DRY, (5,)),
+)
+# Exposed when the device does not report a usable modes bitmask.
+_FALLBACK_HVAC_MODES: tuple[HVACMode, ...] = (
+    HVACMode.COOL,
+    HVACMode.HEAT,
+    HVACMode.FAN_ONLY,
+    HVACMode.DRY,
+)
+
+# Presets always available (mapped to scenary); explicit on/off methods are
+# implemented, so advertise them consistently.
+_FEATURES_BASE = (
+    ClimateEntityFeature.PRESET_MODE
+    | ClimateEntityFeature.TURN_ON
+    | ClimateEntityFeature.TURN_OFF
+)
+# Intentionally dynamic per the backend/UI contract documented in info.md:
+# - DRY: setpoints are not meaningful and fan control is typically not exposed.
+# - FAN_ONLY (including backend alias P2=8): fan control only; no target
+#   temperature because P7/P8 setpoints do not apply.
+# - OFF: no temperature/fan controls.
+_FEATURES_SETPOINT_FAN = (
+    _FEATURES_BASE
+    | ClimateEntityFeature.TARGET_TEMPERATURE
+    | ClimateEntityFeature.FAN_MODE
+)
+_FEATURES_BY_MODE: dict[HVACMode | None, ClimateEntityFeature] = {
+    HVACMode.COOL: _FEATURES_SETPOINT_FAN,
+    HVACMode.HEAT: _FEATURES_SETPOINT_FAN,
+    HVACMode.HEAT_COOL: _FEATURES_SETPOINT_FAN,
+    HVACMode.FAN_ONLY: _FEATURES_BASE | ClimateEntityFeature.FAN_MODE,
+}
+
+# Modes that expose a setpoint: P# option to write it and the snapshot key.
+_SETPOINT_BY_MODE: dict[HVACMode | None, tuple[str, str]] = {
+    HVACMode.COOL: ("P7", "cold_consign"),
+    HVACMode.HEAT_COOL: ("P7", "cold_consign"),
+    HVACMode.HEAT: ("P8", "heat_consign"),
+}
+
+# Fan speed routing: P3/cold_speed or P4/heat_speed. FAN_ONLY is resolved at
+# runtime from the backend mode code (see AirzoneClimate._fan_route).
+_FAN_ROUTE_COLD: tuple[str, str] = ("P3", "cold_speed")
+_FAN_ROUTE_HEAT: tuple[str, str] = ("P4", "heat_speed")
+_FAN_ROUTE_BY_MODE: dict[HVACMode | None, tuple[str, str]] = {
+    HVACMode.COOL: _FAN_ROUTE_COLD,
+    HVACMode.HEAT_COOL: _FAN_ROUTE_COLD,
+    HVACMode.HEAT: _FAN_ROUTE_HEAT,
+}
+
+# P7/P8 payload strings ("NN.0") for every plausible whole-degree setpoint.
+_TEMP_STR: tuple[str, ...] = tuple(f"{i}.0" for i in range(41))
+
+# Fan speed labels used when the device exposes exactly three speeds.
+_NUM_TO_LABEL: dict[str, str] = {"1": "low", "2": "medium", "3": "high"}
+_LABEL_TO_NUM: dict[str, str] = {v: k for k, v in _NUM_TO_LABEL.items()}
+
+# Raw power values with a known meaning (True/False hash like 1/0).
+_POWER_ON_VALUES: frozenset[Any] = frozenset({"1", "on", "true", "yes", 1})
+_POWER_OFF_VALUES: frozenset[Any] = frozenset(
+    {"0", "off", "false", "no", "", "none", None, 0}
+)
+
+# Power strings that let turn_on/turn_off return early (the command-side set;
+# anything else, e.g. "2" or "yes", still sends P1).
+_POWER_SKIP_ON: frozenset[str] = frozenset({"1", "true", "on"})
+_POWER_SKIP_OFF: frozenset[str] = frozenset({"0", "false", "off", ""})
+
+# Sentinel for per-snapshot memoization (None is a valid cached value).
+_MISSING = object()
+
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> None:
     """Set up the climate platform from a config entry using the coordinator snapshot."""
@@ -70,11 +162,10 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
         _LOGGER.error("Coordinator missing for entry %s", entry.entry_id)
         return
 
-    entities: list[AirzoneClimate] = [
+    async_add_entities(
         AirzoneClimate(coordinator, entry.entry_id, device_id)
-        for device_id in list((coordinator.data or {}).keys())
-    ]
-    async_add_entities(entities)
+        for device_id in coordinator.data or {}
+    )
 
 
 class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
@@ -91,11 +182,26 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
         super().__init__(coordinator)
         self._entry_id = entry_id
         self._device_id = device_id
+        # Values derived only from the coordinator snapshot (never from optimistic
+        # overlays); cleared whenever the coordinator publishes new data.
+        self._snapshot_cache: dict[str, Any] = {}
+        self._last_state_signature: tuple[Any, ...] | None = None
+        # Set only while a state write is reading properties (_hvac_mode_pinned).
+        self._hvac_mode_pin: Any = _MISSING
+        # Resolved lazily by _resolve_api(); fixed for the entry's lifetime.
+        self._api: Any = None
+        # Fixed part of every /events payload for this device.
+        self._event_base: dict[str, Any] = {
+            "cgi": "modmaquina",
+            "device_id": device_id,
+        }
 
         device = self._device
         name = device.get("name") or "Airzone Device"
         self._attr_name = name
         self._attr_unique_id = f"{self._device_id}_climate"
+        self._attr_device_info = self._build_device_info(device)
+        self._attr_available = bool(device)
 
     # ---- Helpers ---------------------------------------------------------
 
@@ -104,6 +210,19 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
         """Latest device snapshot (no I/O)."""
         return (self.coordinator.data or {}).get(self._device_id, {})  # type: ignore[no-any-return]
 
+    def _memo(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a snapshot-derived value, computing it once per coordinator update."""
+        value = self._snapshot_cache.get(name, _MISSING)
+        if value is _MISSING:
+            value = self._snapshot_cache[name] = compute()
+        return value
+
+    def _resolve_api(self) -> Any:
+        """Return the coordinator's API handle, cached once it is available."""
+        if self._api is None:
+            self._api = getattr(self.coordinator, "api", None)
+        return self._api
+
     def _overlay_value(self, key: str, backend_value: Any) -> Any:
         """Return the optimistic value for the given key if still valid."""
         return optimistic_get(
@@ -111,6 +230,9 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
         )
 
     def _fan_speed_max(self) -> int:
+        return self._memo("fan_speed_max", self._compute_fan_speed_max)
+
+    def _compute_fan_speed_max(self) -> int:
         try:
             n = int(self._device.get("availables_speeds") or 0)
             return max(0, n)
@@ -124,19 +246,28 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
     @staticmethod
     def _num_to_label(num: str) -> str:
         """Map '1'/'2'/'3' to 'low'/'medium'/'high' (fallback to input if unknown)."""
-        mapping = {"1": "low", "2": "medium", "3": "high"}
-        return mapping.get(str(num), str(num))
+        key = str(num)
+        return _NUM_TO_LABEL.get(key, key)
 
     @staticmethod
     def _label_to_num(label: str) -> str:
         """Map 'low'/'medium'/'high' to '1'/'2'/'3' (fallback to input if unknown)."""
-        norm = (label or "").strip().lower()
-        mapping = {"low": "1", "medium": "2", "high": "3"}
-        return mapping.get(norm, label)
+        return _LABEL_TO_NUM.get((label or "").strip().lower(), label)
 
-    def _device_power_on(self) -> bool:
+    def _device_power_on(self, dev: dict[str, Any] | None = None) -> bool:
         """Normalize backend/optimistic power to bool."""
-        p = self._overlay_value("power", self._device.get("power"))
+        if dev is None:
+            dev = self._device
+        p = self._overlay_value("power", dev.get("power"))
+        try:
+            # Common shapes ("1"/"0", ints, bools, None) resolve without
+            # building normalized strings.
+            if p in _POWER_ON_VALUES:
+                return True
+            if p in _POWER_OFF_VALUES:
+                return False
+        except TypeError:  # unhashable payload; fall through to coercion
+            pass
         s = str(p).strip().lower()
         if s in ("1", "on", "true", "yes"):
             return True
@@ -149,17 +280,30 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
         except Exception:
             return False
 
-    def _backend_mode_code(self) -> str | None:
-        raw = self._overlay_value("mode", self._device.get("mode"))
+    def _backend_mode_code(self, dev: dict[str, Any] | None = None) -> str | None:
+        if dev is None:
+            dev = self._device
+        raw = self._overlay_value("mode", dev.get("mode"))
         return str(raw) if raw is not None else None
 
     def _modes_bitstring(self) -> str:
-        return parse_modes_bitmask(self._device.get("modes"))
+        return self._memo(
+            "modes_bitstring", lambda: parse_modes_bitmask(self._device.get("modes"))
+        )
+
+    def _modes_mask(self) -> int:
+        """Bitmask as an int: bit N-1 set when P2=N is supported."""
+        return self._memo(
+            "modes_mask", lambda: int(self._modes_bitstring()[::-1] or "0", 2)
+        )
 
     def _supports_p2_value(self, code: int) -> bool:
-        return bitmask_supports_p2(self._modes_bitstring(), code)
+        return code >= 1 and bool(self._modes_mask() >> (code - 1) & 1)
 
     def _preferred_ventilate_code(self) -> str | None:
+        return self._memo("ventilate_code", self._compute_preferred_ventilate_code)
+
+    def _compute_preferred_ventilate_code(self) -> str | None:
         if self._supports_p2_value(3):
             return "3"
         if self._supports_p2_value(8):
@@ -183,50 +327,34 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
     def _heat_cool_enabled(self) -> bool:
         return self._heat_cool_opt_in() and self._supports_p2_value(4)
 
-    def _hvac_from_device(self) -> HVACMode | None:
-        if not self._device_power_on():
-            return HVACMode.OFF
-        code = self._backend_mode_code()
-        if not code:
+    def _hvac_from_device(self, dev: dict[str, Any] | None = None) -> HVACMode | None:
+        if self._hvac_mode_pin is not _MISSING:
+            return self._hvac_mode_pin  # type: ignore[no-any-return]
+        # Callers that already hold the snapshot pass it in to avoid re-resolving it.
+        if dev is None:
+            dev = self._device
+        if not self._device_power_on(dev):
             return HVACMode.OFF
-        if code not in MODE_TO_HVAC:
-            return HVACMode.OFF
-        return MODE_TO_HVAC[code]
+        # Missing/unknown codes map to OFF, same as a powered-off unit.
+        return MODE_TO_HVAC.get(self._backend_mode_code(dev), HVACMode.OFF)
 
     # ---- Preset/scenary mapping -----------------------------------------
 
     @staticmethod
     def _scenary_to_preset(scenary: str | None) -> str | None:
-        s = (scenary or "").strip().lower()
-        if s == "occupied":
-            return "home"
-        if s == "vacant":
-            return "away"
-        if s == "sleep":
-            return "sleep"
-        return None
-
-    @staticmethod
-    def _preset_to_scenary(preset: str) -> str | None:
-        p = (preset or "").strip().lower()
-        if p == "home":
-            return "occupied"
-        if p == "away":
-            return "vacant"
-        if p == "sleep":
-            return "sleep"
-        return None
+        return _SCENARY_TO_PRESET.get((scenary or "").strip().lower())
 
     # ---- Device info -----------------------------------------------------
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self, dev: dict[str, Any]) -> DeviceInfo:
         """Return rich device metadata for the device registry.
 
+        Built once at construction: Home Assistant only consumes device_info when
+        the entity is registered, so rebuilding it on every read is wasted work.
+
         NOTE: We pass the MAC through the constructor 'connections' using
         CONNECTION_NETWORK_MAC and avoid mutating the object after creation.
         """
-        dev = self._device
         mac = (str(dev.get("mac") or "").strip()) or None
         connections = {(CONNECTION_NETWORK_MAC, mac)} if mac else None
 
@@ -247,42 +375,30 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
-        modes = [HVACMode.OFF]
-        bitstr = self._modes_bitstring()
+        modes: list[HVACMode] = self._memo("hvac_modes", self._compute_hvac_modes)
+        if HVACMode.HEAT_COOL not in modes and self.hvac_mode == HVACMode.HEAT_COOL:
+            return [*modes, HVACMode.HEAT_COOL]
+        return modes
+
+    def _compute_hvac_modes(self) -> list[HVACMode]:
+        """Build the bitmask-driven mode list (HEAT_COOL opt-in is fixed per entry)."""
+        if not self._modes_bitstring():
+            return [HVACMode.OFF, *_FALLBACK_HVAC_MODES]
+
         heat_cool_opt_in = self._heat_cool_opt_in()
-        heat_cool_supported = self._supports_p2_value(4)
-        heat_cool_enabled = heat_cool_supported and heat_cool_opt_in
-
-        current_mode = self.hvac_mode
-
-        if bitstr:
-            if self._supports_p2_value(1):
-                modes.append(HVACMode.COOL)
-            if self._supports_p2_value(2):
-                modes.append(HVACMode.HEAT)
-            fan_supported = self._supports_p2_value(3) or self._supports_p2_value(8)
-            if fan_supported:
-                modes.append(HVACMode.FAN_ONLY)
-            if heat_cool_enabled:
-                modes.append(HVACMode.HEAT_COOL)
-            if self._supports_p2_value(5):
-                modes.append(HVACMode.DRY)
-            if current_mode == HVACMode.HEAT_COOL and HVACMode.HEAT_COOL not in modes:
-                modes.append(HVACMode.HEAT_COOL)
-            return modes
-
-        modes.extend([HVACMode.COOL, HVACMode.HEAT])
-        modes.append(HVACMode.FAN_ONLY)
-        modes.append(HVACMode.DRY)
-        if current_mode == HVACMode.HEAT_COOL and HVACMode.HEAT_COOL not in modes:
-            modes.append(HVACMode.HEAT_COOL)
+        modes = [HVACMode.OFF]
+        for mode, codes in _BITMASK_HVAC_MODES:
+            if mode == HVACMode.HEAT_COOL and not heat_cool_opt_in:
+                continue
+            if any(self._supports_p2_value(code) for code in codes):
+                modes.append(mode)
         return modes
 
     # ---- Presets (HA) ----------------------------------------------------
 
     @property
     def preset_modes(self) -> list[str] | None:
-        return ["home", "away", "sleep"]
+        return self._memo("preset_modes", lambda: list(_PRESET_MODES))
 
     @property
     def preset_mode(self) -> str | None:
@@ -294,22 +410,18 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Map HA preset → backend scenary and write via put_device_fields()."""
-        if preset_mode not in (self.preset_modes or []):
+        # The mapping doubles as the allow-list (its keys are preset_modes).
+        scenary = _PRESET_TO_SCENARY.get(preset_mode)
+        if scenary is None:
             _LOGGER.debug(
-                "Invalid preset_mode %s (allowed %s)", preset_mode, self.preset_modes
+                "Invalid preset_mode %s (allowed %s)", preset_mode, _PRESET_MODES
             )
             return
 
-        current = self.preset_mode
-        if current == preset_mode:
-            return
-
-        scenary = self._preset_to_scenary(preset_mode)
-        if not scenary:
-            _LOGGER.debug("Unsupported preset -> scenary mapping: %s", preset_mode)
+        if self.preset_mode == preset_mode:
             return
 
-        api = getattr(self.coordinator, "api", None)
+        api = self._resolve_api()
         if api is None:
             _LOGGER.error("API handle missing in coordinator; cannot set scenary")
             return
@@ -335,10 +447,7 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
             optimistic_set(
                 self.hass, self._entry_id, self._device_id, "scenary", scenary
             )
-            self.async_write_ha_state()
-            schedule_post_write_refresh(
-                self.hass, self.coordinator, entry_id=self._entry_id
-            )
+            self._async_finish_write()
 
     # ---- Auto-exit AWAY on active commands -------------------------------
 
@@ -378,30 +487,44 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
     def _parse_float(val: Any) -> float | None:
         if val is None:
             return None
+        # Exact-type checks keep bools on the string path (they never parsed).
+        if type(val) is float:
+            return val  # type: ignore[no-any-return]
+        if type(val) is int:
+            return float(val)
+        text = val if type(val) is str else str(val)
         try:
-            return float(str(val).replace(",", "."))
+            return float(text.replace(",", ".") if "," in text else text)
         except Exception:
             return None
 
     @property
     def target_temperature(self) -> float | None:
-        mode = self.hvac_mode
-        if mode in (HVACMode.COOL, HVACMode.HEAT_COOL):
-            val = self._overlay_value("cold_consign", self._device.get("cold_consign"))
-        elif mode == HVACMode.HEAT:
-            val = self._overlay_value("heat_consign", self._device.get("heat_consign"))
-        else:
+        dev = self._device
+        setpoint = _SETPOINT_BY_MODE.get(self._hvac_from_device(dev))
+        if setpoint is None:
             # DRY / FAN_ONLY / OFF: do not expose target temperature
             return None
-        return self._parse_float(val)
+        key = setpoint[1]
+        return self._parse_float(self._overlay_value(key, dev.get(key)))
+
+    def _temp_limits(self, bound: str) -> tuple[float | None, float | None]:
+        """Return the parsed (cold, heat) limits for "min" or "max"."""
+        return self._memo(
+            f"{bound}_limits",
+            lambda: (
+                self._parse_float(self._device.get(f"{bound}_limit_cold")),
+                self._parse_float(self._device.get(f"{bound}_limit_heat")),
+            ),
+        )
 
     @property
     def min_temp(self) -> float:
         """Return min allowable temp (per mode; neutral combo in OFF/DRY/FAN_ONLY)."""
-        dev = self._device
-        mode = self.hvac_mode
-        cold = self._parse_float(dev.get("min_limit_cold"))
-        heat = self._parse_float(dev.get("min_limit_heat"))
+        return self._min_temp_for(self.hvac_mode)
+
+    def _min_temp_for(self, mode: HVACMode | None) -> float:
+        cold, heat = self._temp_limits("min")
         if mode in (HVACMode.COOL, HVACMode.HEAT_COOL) and cold is not None:
             return cold
         if mode == HVACMode.HEAT and heat is not None:
@@ -412,10 +535,10 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
     @property
     def max_temp(self) -> float:
         """Return max allowable temp (per mode; neutral combo in OFF/DRY/FAN_ONLY)."""
-        dev = self._device
-        mode = self.hvac_mode
-        cold = self._parse_float(dev.get("max_limit_cold"))
-        heat = self._parse_float(dev.get("max_limit_heat"))
+        return self._max_temp_for(self.hvac_mode)
+
+    def _max_temp_for(self, mode: HVACMode | None) -> float:
+        cold, heat = self._temp_limits("max")
         if mode in (HVACMode.COOL, HVACMode.HEAT_COOL) and cold is not None:
             return cold
         if mode == HVACMode.HEAT and heat is not None:
@@ -432,7 +555,8 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
             return
 
         mode = self.hvac_mode
-        if mode not in (HVACMode.COOL, HVACMode.HEAT, HVACMode.HEAT_COOL):
+        setpoint = _SETPOINT_BY_MODE.get(mode)
+        if setpoint is None:
             _LOGGER.debug("Ignoring set_temperature in mode %s", mode)
             return
 
@@ -440,47 +564,43 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
 
         temp = clamp_temperature(
             requested,
-            min_temp=self.min_temp,
-            max_temp=self.max_temp,
+            min_temp=self._min_temp_for(mode),
+            max_temp=self._max_temp_for(mode),
             step=1,
         )
 
         temp_int = int(round(float(temp)))
+        # UI re-sends of the current setpoint would be a wasted round trip.
+        if self.target_temperature == temp_int:
+            return
 
         lock = acquire_device_lock(self.hass, self._entry_id, self._device_id)
         async with lock:
-            if mode in (HVACMode.COOL, HVACMode.HEAT_COOL):
-                await self._send_p_event("P7", f"{temp_int}.0")
-                optimistic_set(
-                    self.hass,
-                    self._entry_id,
-                    self._device_id,
-                    "cold_consign",
-                    temp_int,
-                )
-            else:
-                await self._send_p_event("P8", f"{temp_int}.0")
-                optimistic_set(
-                    self.hass,
-                    self._entry_id,
-                    self._device_id,
-                    "heat_consign",
-                    temp_int,
-                )
+            option, key = setpoint
+            await self._send_p_event(option, self._temp_payload(temp_int))
+            optimistic_set(self.hass, self._entry_id, self._device_id, key, temp_int)
+            self._async_finish_write()
 
-            self.async_write_ha_state()
-            schedule_post_write_refresh(
-                self.hass, self.coordinator, entry_id=self._entry_id
-            )
+    @staticmethod
+    def _temp_payload(temp_int: int) -> str:
+        """Return the P7/P8 setpoint string for a whole-degree value."""
+        if 0 <= temp_int < len(_TEMP_STR):
+            return _TEMP_STR[temp_int]
+        return f"{temp_int}.0"
 
     # ---- Fan control -----------------------------------------------------
 
     @property
     def fan_modes(self) -> list[str] | None:
         """Expose common labels when exactly 3 speeds exist; otherwise numeric."""
-        mode = self.hvac_mode
+        return self._fan_modes_for(self.hvac_mode)
+
+    def _fan_modes_for(self, mode: HVACMode | None) -> list[str] | None:
         if mode in (HVACMode.OFF, HVACMode.DRY) or mode is None:
             return None
+        return self._memo("fan_modes_all", self._compute_fan_modes_all)
+
+    def _compute_fan_modes_all(self) -> list[str] | None:
         n = self._fan_speed_max()
         if n <= 0:
             return None
@@ -488,22 +608,28 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
             return ["low", "medium", "high"]
         return [str(i) for i in range(1, n + 1)]
 
+    def _fan_route(
+        self, mode: HVACMode | None, dev: dict[str, Any] | None = None
+    ) -> tuple[str, str]:
+        """Return the (P# option, speed key) driving the fan in this mode."""
+        route = _FAN_ROUTE_BY_MODE.get(mode)
+        if route is None:
+            # FAN_ONLY: the backend alias P2=8 ventilates on the heat speed.
+            if self._backend_mode_code(dev) == "8":
+                return _FAN_ROUTE_HEAT
+            return _FAN_ROUTE_COLD
+        return route
+
     @property
     def fan_mode(self) -> str | None:
         """Return current fan mode; map 1/2/3 to low/medium/high when normalized."""
-        mode = self.hvac_mode
+        dev = self._device
+        mode = self._hvac_from_device(dev)
         if mode in (HVACMode.OFF, HVACMode.DRY) or mode is None:
             return None
 
-        if mode == HVACMode.HEAT:
-            key = "heat_speed"
-        elif mode in (HVACMode.COOL, HVACMode.HEAT_COOL):
-            key = "cold_speed"
-        else:  # FAN_ONLY
-            code = self._backend_mode_code()
-            key = "heat_speed" if code == "8" else "cold_speed"
-
-        val = self._overlay_value(key, self._device.get(key))
+        key = self._fan_route(mode, dev)[1]
+        val = self._overlay_value(key, dev.get(key))
         if not val:
             return None
 
@@ -518,12 +644,14 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
         if mode in (HVACMode.OFF, HVACMode.DRY) or mode is None:
             _LOGGER.debug("Ignoring set_fan_mode in mode %s", mode)
             return
-        allowed = self.fan_modes or []
+        allowed = self._fan_modes_for(mode) or []
         if fan_mode not in allowed:
             _LOGGER.debug("Invalid fan_mode %s (allowed %s)", fan_mode, allowed)
             return
 
         await self._auto_exit_away_if_needed("set_fan_mode")
+        if fan_mode == self.fan_mode:
+            return
 
         # Map label to numeric when normalized
         value_to_send = (
@@ -532,20 +660,7 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
             else fan_mode
         )
 
-        if mode == HVACMode.HEAT:
-            option = "P4"
-            key = "heat_speed"
-        elif mode in (HVACMode.COOL, HVACMode.HEAT_COOL):
-            option = "P3"
-            key = "cold_speed"
-        else:
-            code = self._backend_mode_code()
-            if code == "8":
-                option = "P4"
-                key = "heat_speed"
-            else:
-                option = "P3"
-                key = "cold_speed"
+        option, key = self._fan_route(mode)
 
         lock = acquire_device_lock(self.hass, self._entry_id, self._device_id)
         async with lock:
@@ -554,16 +669,18 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
                 self.hass, self._entry_id, self._device_id, key, value_to_send
             )
 
-            self.async_write_ha_state()
-            schedule_post_write_refresh(
-                self.hass, self.coordinator, entry_id=self._entry_id
-            )
+            self._async_finish_write()
 
     # ---- Power / mode ----------------------------------------------------
 
-    async def async_turn_on(self) -> None:
+    def _power_state_already(self, want_on: bool) -> bool:
+        """True if the power (backend + overlay) already reads as the target."""
         current = str(self._overlay_value("power", self._device.get("power")) or "")
-        if current.strip().lower() in {"1", "true", "on"}:
+        skip = _POWER_SKIP_ON if want_on else _POWER_SKIP_OFF
+        return current.strip().lower() in skip
+
+    async def async_turn_on(self) -> None:
+        if self._power_state_already(True):
             return
 
         await self._ensure_occupied_before_active_action("turn_on")
@@ -571,37 +688,30 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
         backend_on = str(self._device.get("power", "0")).strip() == "1"
         if backend_on:
             optimistic_invalidate(self.hass, self._entry_id, self._device_id, "power")
-            self.async_write_ha_state()
+            self._async_write_ha_state_if_changed()
             return
 
         lock = acquire_device_lock(self.hass, self._entry_id, self._device_id)
         async with lock:
             await self._send_p_event("P1", 1)
             optimistic_set(self.hass, self._entry_id, self._device_id, "power", "1")
-            self.async_write_ha_state()
-            schedule_post_write_refresh(
-                self.hass, self.coordinator, entry_id=self._entry_id
-            )
+            self._async_finish_write()
 
     async def async_turn_off(self) -> None:
-        current = str(self._overlay_value("power", self._device.get("power")) or "")
-        if current.strip().lower() in {"0", "false", "off", ""}:
+        if self._power_state_already(False):
             return
 
         backend_off = str(self._device.get("power", "0")).strip() != "1"
         if backend_off:
             optimistic_invalidate(self.hass, self._entry_id, self._device_id, "power")
-            self.async_write_ha_state()
+            self._async_write_ha_state_if_changed()
             return
 
         lock = acquire_device_lock(self.hass, self._entry_id, self._device_id)
         async with lock:
             await self._send_p_event("P1", 0)
             optimistic_set(self.hass, self._entry_id, self._device_id, "power", "0")
-            self.async_write_ha_state()
-            schedule_post_write_refresh(
-                self.hass, self.coordinator, entry_id=self._entry_id
-            )
+            self._async_finish_write()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         lock = acquire_device_lock(self.hass, self._entry_id, self._device_id)
@@ -613,80 +723,57 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
                 optimistic_invalidate(
                     self.hass, self._entry_id, self._device_id, "mode"
                 )
-                self.async_write_ha_state()
-                schedule_post_write_refresh(
-                    self.hass, self.coordinator, entry_id=self._entry_id
-                )
+                self._async_finish_write()
             return
 
         await self._ensure_occupied_before_active_action("set_hvac_mode")
 
-        if self._device_power_on() and self._hvac_from_device() == hvac_mode:
+        # hvac_mode is not OFF here, so a match also implies the unit is on.
+        if self.hvac_mode == hvac_mode:
             _LOGGER.debug(
                 "HVAC mode %s already active; skipping redundant P2", hvac_mode
             )
             return
 
+        if hvac_mode == HVACMode.FAN_ONLY:
+            mode_code = self._preferred_ventilate_code()
+            if mode_code is None:
+                _LOGGER.debug(
+                    "Ignoring set_hvac_mode=fan_only: device bitmask lacks P2=3/8"
+                )
+                return
+        else:
+            if hvac_mode == HVACMode.HEAT_COOL and not self._heat_cool_enabled():
+                _LOGGER.debug(
+                    "Ignoring set_hvac_mode=heat_cool: opt-in disabled or device unsupported"
+                )
+                return
+            mode_code = HVAC_TO_MODE.get(hvac_mode)
+            if not mode_code:
+                _LOGGER.debug("Ignoring unsupported set_hvac_mode=%s", hvac_mode)
+                return
+
         async with lock:
-            if str(self._device.get("power", "0")).strip() != "1":
-                await self._send_p_event("P1", 1)
-                optimistic_set(self.hass, self._entry_id, self._device_id, "power", "1")
-
-            if hvac_mode == HVACMode.FAN_ONLY:
-                code = self._preferred_ventilate_code()
-                if code is None:
-                    _LOGGER.debug(
-                        "Ignoring set_hvac_mode=fan_only: device bitmask lacks P2=3/8"
-                    )
-                    return
-                await self._send_p_event("P2", code)
-                optimistic_set(self.hass, self._entry_id, self._device_id, "mode", code)
-                optimistic_set(self.hass, self._entry_id, self._device_id, "power", "1")
-            else:
-                if hvac_mode == HVACMode.HEAT_COOL and not self._heat_cool_enabled():
-                    _LOGGER.debug(
-                        "Ignoring set_hvac_mode=heat_cool: opt-in disabled or device unsupported"
-                    )
-                    return
-                mode_code = HVAC_TO_MODE.get(hvac_mode)
-                if mode_code:
-                    await self._send_p_event("P2", mode_code)
-                    optimistic_set(
-                        self.hass, self._entry_id, self._device_id, "mode", mode_code
-                    )
-                    optimistic_set(
-                        self.hass, self._entry_id, self._device_id, "power", "1"
-                    )
-
-            self.async_write_ha_state()
-            schedule_post_write_refresh(
-                self.hass, self.coordinator, entry_id=self._entry_id
+            events: list[tuple[str, Any]] = []
+            # Overlay-aware: a just-sent P1=1 is not repeated, and a just-sent
+            # P1=0 the backend has not reported yet is undone.
+            if not self._device_power_on():
+                events.append(("P1", 1))
+            events.append(("P2", mode_code))
+            await self._send_p_events(events)
+
+            optimistic_set(
+                self.hass, self._entry_id, self._device_id, "mode", mode_code
             )
+            optimistic_set(self.hass, self._entry_id, self._device_id, "power", "1")
+            self._async_finish_write()
 
     # ---- Features --------------------------------------------------------
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
         """Return IntFlag capabilities; NEVER return a plain int."""
-        feats: ClimateEntityFeature = ClimateEntityFeature(0)
-        mode = self.hvac_mode
-        if mode in (HVACMode.COOL, HVACMode.HEAT, HVACMode.HEAT_COOL):
-            feats |= ClimateEntityFeature.TARGET_TEMPERATURE
-            feats |= ClimateEntityFeature.FAN_MODE
-        elif mode == HVACMode.FAN_ONLY:
-            feats |= ClimateEntityFeature.FAN_MODE
-        # Intentionally dynamic per the backend/UI contract documented in info.md:
-        # - DRY: setpoints are not meaningful and fan control is typically not exposed.
-        # - FAN_ONLY (including backend alias P2=8): fan control only; no target
-        #   temperature because P7/P8 setpoints do not apply.
-        # - OFF: no temperature/fan controls.
-
-        # Presets always available (mapped to scenary)
-        feats |= ClimateEntityFeature.PRESET_MODE
-
-        # Explicit on/off methods implemented: advertise consistently
-        feats |= ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-        return feats
+        return _FEATURES_BY_MODE.get(self.hvac_mode, _FEATURES_BASE)
 
     # ---- Write helpers ---------------------------------------------------
 
@@ -695,19 +782,12 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
 
         {"event":{"cgi":"modmaquina","device_id":<id>,"option":"P#","value":...}}
         """
-        api = getattr(self.coordinator, "api", None)
+        api = self._resolve_api()
         if api is None:
             _LOGGER.error("API handle missing in coordinator; cannot send_event")
             return
 
-        payload = {
-            "event": {
-                "cgi": "modmaquina",
-                "device_id": self._device_id,
-                "option": option,
-                "value": value,
-            }
-        }
+        payload = {"event": {**self._event_base, "option": option, "value": value}}
         try:
             await api.send_event(payload)
         except asyncio.CancelledError:
@@ -722,18 +802,99 @@ class AirzoneClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
             )
             raise
 
+    @callback
+    def _async_finish_write(self) -> None:
+        """Publish the optimistic state and queue the coalesced post-write refresh."""
+        self._async_write_ha_state_if_changed()
+        schedule_post_write_refresh(
+            self.hass, self.coordinator, entry_id=self._entry_id
+        )
+
+    async def _send_p_events(self, events: Sequence[tuple[str, Any]]) -> None:
+        """Send several P# commands for this device, in order.
+
+        /events takes a single event per request (see info.md), so commands
+        are sent back-to-back over the shared session instead of batched.
+        They are deliberately not gathered: concurrent requests may reach the
+        backend in any order, and e.g. P2 before P1 leaves the unit off. The
+        first failure also stops the remaining commands.
+        """
+        for option, value in events:
+            await self._send_p_event(option, value)
+
     # ---- Coordinator update hook ----------------------------------------
 
+    async def async_added_to_hass(self) -> None:
+        # The snapshot may have been refreshed between construction and add.
+        self._snapshot_cache.clear()
+        self._attr_available = bool(self._device)
+        await super().async_added_to_hass()
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Everything this entity publishes to the state machine."""
+        fan_modes = self.fan_modes
+        return (
+            self.available,
+            self._attr_name,
+            self.hvac_mode,
+            tuple(self.hvac_modes),
+            self.current_temperature,
+            self.target_temperature,
+            self.min_temp,
+            self.max_temp,
+            self.fan_mode,
+            tuple(fan_modes) if fan_modes is not None else None,
+            self.preset_mode,
+            self.supported_features,
+        )
+
+    @contextmanager
+    def _hvac_mode_pinned(self) -> Iterator[None]:
+        """Resolve the HVAC mode once for a burst of property reads.
+
+        A state write reads most properties back to back and each of them
+        derives the mode from power + mode code (+ overlays). Nested pins reuse
+        the outer value.
+        """
+        if self._hvac_mode_pin is not _MISSING:
+            yield
+            return
+        self._hvac_mode_pin = self._hvac_from_device()
+        try:
+            yield
+        finally:
+            self._hvac_mode_pin = _MISSING
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        with self._hvac_mode_pinned():
+            self._last_state_signature = self._state_signature()
+            super().async_write_ha_state()
+
+    @callback
+    def _async_write_ha_state_if_changed(self) -> None:
+        """Write state after a command unless it left the entity looking the same."""
+        with self._hvac_mode_pinned():
+            signature = self._state_signature()
+            if signature == self._last_state_signature:
+                return
+            self._last_state_signature = signature
+            super().async_write_ha_state()
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        self._snapshot_cache.clear()
         device = self._device
+        self._attr_available = bool(device)
         name = device.get("name") or self._attr_name
         if name:
             self._attr_name = name
-        super()._handle_coordinator_update()
+        # Polls usually return an unchanged device; skip the state write then.
+        self._async_write_ha_state_if_changed()
 
     # ---- Availability / update ------------------------------------------
 
     @property
     def available(self) -> bool:
-        return bool(self._device)
+        # Refreshed with each snapshot in _handle_coordinator_update.
+        return self._attr_available
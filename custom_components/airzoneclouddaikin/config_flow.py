@@ -16,7 +16,6 @@ Contract
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -27,6 +26,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .airzone_api import AirzoneAPI
 from .const import (
     CONF_ENABLE_HEAT_COOL,
     CONF_SLEEP_TIMEOUT_ENABLED,
@@ -43,6 +43,10 @@ CONF_EXPOSE_PII = "expose_pii_identifiers"
 # UI guardrails
 MIN_SCAN, MAX_SCAN = 10, 30
 
+# Validators/schemas that do not depend on per-form defaults are built once
+_SCAN_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN, max=MAX_SCAN))
+_REAUTH_SCHEMA = vol.Schema({vol.Required(CONF_PASSWORD): cv.string})
+
 
 def _user_schema(defaults: dict[str, Any]) -> vol.Schema:
     return vol.Schema(
@@ -53,7 +57,7 @@ def _user_schema(defaults: dict[str, Any]) -> vol.Schema:
             vol.Required(CONF_PASSWORD): cv.string,
             vol.Optional(
                 CONF_SCAN_INTERVAL, default=defaults.get(CONF_SCAN_INTERVAL, 10)
-            ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN, max=MAX_SCAN)),
+            ): _SCAN_VALIDATOR,
             vol.Optional(
                 CONF_EXPOSE_PII, default=defaults.get(CONF_EXPOSE_PII, False)
             ): cv.boolean,
@@ -69,7 +73,7 @@ def _options_schema(defaults: dict[str, Any]) -> vol.Schema:
     schema: dict[Any, Any] = {
         vol.Optional(
             CONF_SCAN_INTERVAL, default=defaults.get(CONF_SCAN_INTERVAL, 10)
-        ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN, max=MAX_SCAN)),
+        ): _SCAN_VALIDATOR,
         vol.Optional(
             CONF_EXPOSE_PII, default=defaults.get(CONF_EXPOSE_PII, False)
         ): cv.boolean,
@@ -86,11 +90,17 @@ def _options_schema(defaults: dict[str, Any]) -> vol.Schema:
     return vol.Schema(schema)
 
 
+# Initial user form (no defaults yet); re-renders with input still build per call
+_USER_SCHEMA = _user_schema({})
+
+
 class AirzoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Primary config flow for the integration."""
 
     VERSION = 2
 
+    _reauth_entry: config_entries.ConfigEntry | None = None
+
     @staticmethod
     def async_get_options_flow(
         entry: config_entries.ConfigEntry,
@@ -98,6 +108,38 @@ class AirzoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Expose the options flow handler (top-level class below)."""
         return AirzoneOptionsFlow(entry)
 
+    # ------------------------- Login -------------------------
+    async def _async_login(
+        self, username: str, password: str
+    ) -> tuple[str | None, str | None]:
+        """Log in once and return (token, error_key); exactly one is None."""
+        session = async_get_clientsession(self.hass)
+        # Signature across the integration: (username, session, password=..., token=...)
+        api = AirzoneAPI(username, session, password=password, token=None)
+
+        try:
+            # Be tolerant whether login() returns bool or token; prefer api.token finally.
+            # The API bounds each request with its own ClientTimeout (REQUEST_TIMEOUT).
+            login_ret = await api.login()
+        except TimeoutError:
+            return None, "timeout"
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning(
+                "Login failed (network/other): %s", type(exc).__name__, exc_info=True
+            )
+            return None, "cannot_connect"
+        finally:
+            # Drop the API's reference to the password; this is all the flow can clear
+            api.clear_password()
+
+        token: Any = getattr(api, "token", None)
+        if isinstance(login_ret, str) and login_ret:
+            token = login_ret
+
+        if not isinstance(token, str) or not token.strip():
+            return None, "invalid_auth"
+        return token, None
+
     # ------------------------- Initial setup -------------------------
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -105,7 +147,7 @@ class AirzoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Collect credentials, perform login to obtain token, and create the entry."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=_user_schema({}), errors={}
+                step_id="user", data_schema=_USER_SCHEMA, errors={}
             )
 
         # Work on a shallow copy so we can normalize fields used as form defaults
@@ -113,7 +155,8 @@ class AirzoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         email = str(user_input.get(CONF_USERNAME, "")).strip()
         user_input[CONF_USERNAME] = email
-        password = str(user_input.get(CONF_PASSWORD, ""))
+        # Pop the password so the copy reused as form defaults never holds it
+        password = str(user_input.pop(CONF_PASSWORD, ""))
         # NOTE: We deliberately use the generic "invalid_auth" error here so that
         # empty credentials and bad credentials share the same translated message,
         # without introducing additional per-field error keys in translations.
@@ -133,55 +176,12 @@ class AirzoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         pii = bool(user_input.get(CONF_EXPOSE_PII, False))
         sleep_timeout_enabled = bool(user_input.get(CONF_SLEEP_TIMEOUT_ENABLED, False))
 
-        # Local import to avoid circulars at HA import time
-        try:
-            from .airzone_api import AirzoneAPI
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.exception("Failed to import AirzoneAPI: %s", type(exc).__name__)
+        token, error = await self._async_login(email, password)
+        if error is not None:
             return self.async_show_form(
                 step_id="user",
                 data_schema=_user_schema(user_input),
-                errors={"base": "unknown"},
-            )
-
-        session = async_get_clientsession(self.hass)
-        # Signature across the integration: (username, session, password=..., token=...)
-        api = AirzoneAPI(email, session, password=password, token=None)
-
-        try:
-            # Be tolerant whether login() returns bool or token; prefer api.token finally.
-            login_ret = await asyncio.wait_for(api.login(), timeout=60.0)
-        except TimeoutError:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=_user_schema(user_input),
-                errors={"base": "timeout"},
-            )
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.warning(
-                "Login failed (network/other): %s", type(exc).__name__, exc_info=True
-            )
-            return self.async_show_form(
-                step_id="user",
-                data_schema=_user_schema(user_input),
-                errors={"base": "cannot_connect"},
-            )
-        finally:
-            # Shorten lifetime of password in memory
-            try:
-                api.clear_password()
-            except Exception:  # noqa: BLE001
-                pass
-
-        token: Any = getattr(api, "token", None)
-        if isinstance(login_ret, str) and login_ret:
-            token = login_ret
-
-        if not isinstance(token, str) or not token.strip():
-            return self.async_show_form(
-                step_id="user",
-                data_schema=_user_schema(user_input),
-                errors={"base": "invalid_auth"},
+                errors={"base": error},
             )
 
         # Create the entry: username in data; token+settings in options
@@ -203,11 +203,10 @@ class AirzoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._reauth_entry_id = (self.context or {}).get("entry_id")
         return await self.async_step_reauth_confirm()
 
-    async def async_step_reauth_confirm(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Ask only for password; refresh the token; never persist password."""
-        # Resolve entry
+    def _resolve_reauth_entry(self) -> config_entries.ConfigEntry | None:
+        """Resolve the entry under reauth once; the form and submit steps reuse it."""
+        if self._reauth_entry is not None:
+            return self._reauth_entry
         entry = None
         if getattr(self, "_reauth_entry_id", None):
             entry = self.hass.config_entries.async_get_entry(self._reauth_entry_id)
@@ -216,62 +215,34 @@ class AirzoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             entries = self.hass.config_entries.async_entries(DOMAIN)
             if len(entries) == 1:
                 entry = entries[0]
+        self._reauth_entry = entry
+        return entry
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask only for password; refresh the token; never persist password."""
+        entry = self._resolve_reauth_entry()
         if entry is None:
             return self.async_abort(reason="reauth_failed")
 
-        username = entry.data.get(CONF_USERNAME)
-        schema = vol.Schema({vol.Required(CONF_PASSWORD): cv.string})
-
-        if user_input is None:
-            return self.async_show_form(
-                step_id="reauth_confirm", data_schema=schema, errors={}
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            token, error = await self._async_login(
+                entry.data.get(CONF_USERNAME), str(user_input[CONF_PASSWORD])
             )
-
-        try:
-            from .airzone_api import AirzoneAPI
-        except Exception:
-            return self.async_abort(reason="reauth_failed")
-
-        session = async_get_clientsession(self.hass)
-        api = AirzoneAPI(
-            username, session, password=str(user_input[CONF_PASSWORD]), token=None
+            if error is None:
+                # Merge options, preserving unknown keys
+                self.hass.config_entries.async_update_entry(
+                    entry, options={**entry.options, "user_token": token}
+                )
+                return self.async_abort(reason="reauth_successful")
+            errors["base"] = error
+
+        return self.async_show_form(
+            step_id="reauth_confirm", data_schema=_REAUTH_SCHEMA, errors=errors
         )
 
-        try:
-            login_ret = await asyncio.wait_for(api.login(), timeout=60.0)
-        except TimeoutError:
-            return self.async_show_form(
-                step_id="reauth_confirm", data_schema=schema, errors={"base": "timeout"}
-            )
-        except Exception:
-            return self.async_show_form(
-                step_id="reauth_confirm",
-                data_schema=schema,
-                errors={"base": "cannot_connect"},
-            )
-        finally:
-            try:
-                api.clear_password()
-            except Exception:  # noqa: BLE001
-                pass
-
-        token: Any = getattr(api, "token", None)
-        if isinstance(login_ret, str) and login_ret:
-            token = login_ret
-
-        if not isinstance(token, str) or not token.strip():
-            return self.async_show_form(
-                step_id="reauth_confirm",
-                data_schema=schema,
-                errors={"base": "invalid_auth"},
-            )
-
-        # Merge options, preserving unknown keys
-        new_opts = dict(entry.options)
-        new_opts["user_token"] = token
-        self.hass.config_entries.async_update_entry(entry, options=new_opts)
-        return self.async_abort(reason="reauth_successful")
-
 
 class AirzoneOptionsFlow(config_entries.OptionsFlow):
     """Options flow that preserves hidden keys (like user_token)."""
@@ -310,39 +281,35 @@ class AirzoneOptionsFlow(config_entries.OptionsFlow):
         opts = self._entry.options
 
         _supports_heat_cool = self._any_device_supports_heat_cool()
-        current_heat_cool = bool(opts.get(CONF_ENABLE_HEAT_COOL, False))
-
-        defaults = {
-            CONF_SCAN_INTERVAL: int(opts.get(CONF_SCAN_INTERVAL, 10)),
-            CONF_EXPOSE_PII: bool(opts.get(CONF_EXPOSE_PII, False)),
-            CONF_ENABLE_HEAT_COOL: current_heat_cool,
-            CONF_SLEEP_TIMEOUT_ENABLED: bool(
-                opts.get(CONF_SLEEP_TIMEOUT_ENABLED, False)
-            ),
-        }
 
         if user_input is None:
+            # Render straight from the stored options; coercion happens on submit
             return self.async_show_form(
                 step_id="init",
-                data_schema=_options_schema(defaults),
+                data_schema=_options_schema(opts),
                 errors={},
             )
 
         # Merge with existing options; never drop `user_token`
-        next_opts = dict(self._entry.options)
-        next_opts[CONF_SCAN_INTERVAL] = int(
-            user_input.get(CONF_SCAN_INTERVAL, defaults[CONF_SCAN_INTERVAL])
-        )
-        next_opts[CONF_EXPOSE_PII] = bool(
-            user_input.get(CONF_EXPOSE_PII, defaults[CONF_EXPOSE_PII])
-        )
-        next_opts[CONF_ENABLE_HEAT_COOL] = bool(
-            user_input.get(CONF_ENABLE_HEAT_COOL, current_heat_cool)
-        )
-        next_opts[CONF_SLEEP_TIMEOUT_ENABLED] = bool(
-            user_input.get(
-                CONF_SLEEP_TIMEOUT_ENABLED, defaults[CONF_SLEEP_TIMEOUT_ENABLED]
-            )
-        )
+        next_opts = {
+            **opts,
+            CONF_SCAN_INTERVAL: int(
+                user_input.get(CONF_SCAN_INTERVAL, opts.get(CONF_SCAN_INTERVAL, 10))
+            ),
+            CONF_EXPOSE_PII: bool(
+                user_input.get(CONF_EXPOSE_PII, opts.get(CONF_EXPOSE_PII, False))
+            ),
+            CONF_ENABLE_HEAT_COOL: bool(
+                user_input.get(
+                    CONF_ENABLE_HEAT_COOL, opts.get(CONF_ENABLE_HEAT_COOL, False)
+                )
+            ),
+            CONF_SLEEP_TIMEOUT_ENABLED: bool(
+                user_input.get(
+                    CONF_SLEEP_TIMEOUT_ENABLED,
+                    opts.get(CONF_SLEEP_TIMEOUT_ENABLED, False),
+                )
+            ),
+        }
 
         return self.async_create_entry(title="", data=next_opts)
@@ -23,7 +23,7 @@ import logging
 from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -95,7 +95,11 @@ def optimistic_get(
 ) -> Any:
     """Return the overlay value if still valid, otherwise the backend value."""
 
-    optimistic = _optimistic_bucket(hass, entry_id)
+    # Read path: plain lookups only, so the common "no overlay" case neither
+    # creates buckets nor reads the loop clock.
+    optimistic = hass.data.get(DOMAIN, {}).get(entry_id, {}).get("optimistic")
+    if not optimistic:
+        return backend_value
     device_overlay = optimistic.get(device_id)
     if not device_overlay:
         return backend_value
@@ -158,19 +162,17 @@ def schedule_post_write_refresh(
         hass.async_create_task(coordinator.async_request_refresh())
         return None
 
-    async def _refresh(_now: Any) -> None:
+    # Plain callback: async_call_later runs it inline on the loop instead of
+    # wrapping a coroutine in a task just to create the refresh task.
+    @callback
+    def _refresh(_now: Any) -> None:
+        if bucket.get("pending_refresh") is cancel:
+            bucket["pending_refresh"] = None
         try:
-            # NOTE: If this task is cancelled (e.g. during HA shutdown),
-            # asyncio.CancelledError will propagate, but the cleanup in the
-            # finally block below will still run.
-            hass.async_create_task(coordinator.async_request_refresh())
-        finally:
-            if bucket.get("pending_refresh") is cancel:
-                bucket["pending_refresh"] = None
-            try:
-                cancel_handles.remove(cancel)
-            except ValueError:
-                pass
+            cancel_handles.remove(cancel)
+        except ValueError:
+            pass
+        hass.async_create_task(coordinator.async_request_refresh())
 
     cancel = async_call_later(hass, delay, _refresh)
     bucket["pending_refresh"] = cancel
@@ -254,7 +256,8 @@ def parse_modes_bitmask(value: Any) -> str:
         return ""
 
     bitmask = bitmask.strip()
-    if bitmask and all(ch in "01" for ch in bitmask):
+    # strip("01") leaves nothing only when every character is a 0 or 1.
+    if bitmask and not bitmask.strip("01"):
         return bitmask
     return ""
 
@@ -113,6 +113,7 @@ class _BaseDKNNumber(CoordinatorEntity[AirzoneCoordinator], NumberEntity):
         self._entry_id = entry_id
         self._device_id = device_id
         self._attr_unique_id = f"{device_id}_{unique_suffix}"
+        self._attr_device_info = self._build_device_info(self._device)
         self._attr_mode = NumberMode.SLIDER
         self._attr_entity_category = EntityCategory.CONFIG
         self._attr_native_min_value = self._native_min
@@ -124,14 +125,12 @@ class _BaseDKNNumber(CoordinatorEntity[AirzoneCoordinator], NumberEntity):
         return (self.coordinator.data or {}).get(self._device_id, {})
 
     # ---------- Device registry ----------
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self, device: dict[str, Any]) -> DeviceInfo:
         """Return device registry info (PII-safe and unified across platforms).
 
         NOTE: Pass MAC via 'connections' at construction time using
         CONNECTION_NETWORK_MAC; avoid mutating the object after creation.
         """
-        device = self._device
         mac = (str(device.get("mac") or "").strip()) or None
         connections = {(CONNECTION_NETWORK_MAC, mac)} if mac else None
 
@@ -324,6 +324,7 @@ class AirzoneSensor(CoordinatorEntity[AirzoneCoordinator], SensorEntity):
         self._attr_name = friendly
         self._attr_icon = icon
         self._attr_unique_id = f"{device_id}_{attribute}"
+        self._attr_device_info = self._build_device_info(self._device)
         self._is_pii: bool = attribute in PII_ATTRS
 
         self._attr_entity_category = (
@@ -355,14 +356,12 @@ class AirzoneSensor(CoordinatorEntity[AirzoneCoordinator], SensorEntity):
 
         self._attr_entity_registry_enabled_default = enabled_by_default
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self, dev: dict[str, Any]) -> DeviceInfo:
         """Return unified Device Registry metadata.
 
         NOTE: We pass the MAC through the constructor 'connections' using
         CONNECTION_NETWORK_MAC and avoid mutating the object after creation.
         """
-        dev = self._device
         mac = (str(dev.get("mac") or "").strip()) or None
         connections = {(CONNECTION_NETWORK_MAC, mac)} if mac else None
 
@@ -61,6 +61,7 @@ class AirzonePowerSwitch(CoordinatorEntity[AirzoneCoordinator], SwitchEntity):
         name = dev.get("name") or "Airzone Device"
         self._attr_name = f"{name} Power"
         self._attr_unique_id = f"{device_id}_power"
+        self._attr_device_info = self._build_device_info(dev)
 
     # -----------------------------
     # Helpers
@@ -193,14 +194,12 @@ class AirzonePowerSwitch(CoordinatorEntity[AirzoneCoordinator], SwitchEntity):
         """Return an icon matching the current state."""
         return "mdi:power" if self.is_on else "mdi:power-off"
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self, dev: dict[str, Any]) -> DeviceInfo:
         """Return device registry info (PII-safe and unified across platforms).
 
         NOTE: Pass MAC via 'connections' at construction time using
         CONNECTION_NETWORK_MAC; avoid mutating the object after creation.
         """
-        dev = self._device
         mac = (str(dev.get("mac") or "").strip()) or None
         connections = {(CONNECTION_NETWORK_MAC, mac)} if mac else None
 
@@ -88,6 +88,14 @@ class HomeAssistant:  # pragma: no cover - signature irrelevant for tests
 
 
 core_module.HomeAssistant = HomeAssistant
+
+
+if not hasattr(core_module, "callback"):
+
+    def callback(func):
+        return func
+
+    core_module.callback = callback
 sys.modules["homeassistant.core"] = core_module
 ha_module.core = core_module
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import sys
 import types
@@ -10,6 +11,8 @@ from enum import Enum, IntFlag
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
@@ -440,3 +443,378 @@ def test_supported_features_matrix_by_hvac_mode() -> None:
         }
         entity = _make_climate(device, heat_cool_opt_in=True)
         assert entity.supported_features == expected
+
+
+def _push_snapshot(
+    entity: AirzoneClimate,
+    monkeypatch: Any,
+    snapshot: dict[str, Any],
+) -> list[int]:
+    """Publish a new coordinator snapshot and run the entity update hook."""
+
+    writes: list[int] = []
+    base = AirzoneClimate.__mro__[1]
+    monkeypatch.setattr(
+        base,
+        "_handle_coordinator_update",
+        lambda self: self.async_write_ha_state(),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        base,
+        "async_write_ha_state",
+        lambda self: writes.append(1),
+        raising=False,
+    )
+    entity.coordinator.data = {"device": snapshot}
+    entity._handle_coordinator_update()
+    return writes
+
+
+def test_snapshot_derived_values_refresh_on_coordinator_update(monkeypatch) -> None:
+    """Memoized bitmask/fan data must follow the latest coordinator snapshot."""
+
+    device = {
+        "name": "Zone",
+        "modes": "11101",
+        "mode": "1",
+        "power": "1",
+        "availables_speeds": "3",
+        "min_limit_cold": "18",
+        "max_limit_cold": "30",
+    }
+    entity = _make_climate(device, heat_cool_opt_in=False)
+    assert HVACMode.DRY in entity.hvac_modes
+    assert entity.fan_modes == ["low", "medium", "high"]
+    assert (entity.min_temp, entity.max_temp) == (18.0, 30.0)
+
+    _push_snapshot(
+        entity,
+        monkeypatch,
+        {
+            **device,
+            "modes": "11100",
+            "availables_speeds": "5",
+            "min_limit_cold": "17",
+            "max_limit_cold": "31",
+        },
+    )
+
+    assert HVACMode.DRY not in entity.hvac_modes
+    assert entity.fan_modes == ["1", "2", "3", "4", "5"]
+    assert (entity.min_temp, entity.max_temp) == (17.0, 31.0)
+
+    entity.coordinator.data = {}
+    entity._handle_coordinator_update()
+    assert entity.available is False
+
+
+def test_unchanged_snapshot_skips_state_write(monkeypatch) -> None:
+    """A poll that changes nothing visible must not write state again."""
+
+    device = {
+        "name": "Zone",
+        "modes": "11101",
+        "mode": "1",
+        "power": "1",
+        "cold_consign": "24",
+        "availables_speeds": "3",
+        "cold_speed": "2",
+    }
+    entity = _make_climate(device, heat_cool_opt_in=False)
+
+    assert _push_snapshot(entity, monkeypatch, dict(device)) == [1]
+    assert _push_snapshot(entity, monkeypatch, dict(device)) == []
+    assert _push_snapshot(entity, monkeypatch, {**device, "cold_consign": "23"}) == [1]
+
+
+def test_changed_snapshot_builds_state_signature_once(monkeypatch) -> None:
+    """A poll that does change state must build its signature only once."""
+
+    device = {"name": "Zone", "modes": "11101", "mode": "1", "power": "1"}
+    entity = _make_climate(device, heat_cool_opt_in=False)
+    calls: list[int] = []
+    original = entity._state_signature
+
+    def _counting_signature() -> tuple[Any, ...]:
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(entity, "_state_signature", _counting_signature)
+
+    assert _push_snapshot(entity, monkeypatch, {**device, "mode": "2"}) == [1]
+    assert len(calls) == 1
+
+
+def test_command_state_write_skipped_when_state_is_unchanged(monkeypatch) -> None:
+    """Write paths must not re-publish a state identical to the last one."""
+
+    entity = _make_climate(
+        {"name": "Zone", "modes": "11101", "mode": "1", "power": "1"},
+        heat_cool_opt_in=False,
+    )
+    writes: list[int] = []
+    monkeypatch.setattr(
+        AirzoneClimate.__mro__[1],
+        "async_write_ha_state",
+        lambda self: writes.append(1),
+        raising=False,
+    )
+
+    entity._async_write_ha_state_if_changed()
+    entity._async_write_ha_state_if_changed()
+    assert writes == [1]
+
+
+def test_state_write_resolves_hvac_mode_once(monkeypatch) -> None:
+    """All properties read during one state write share a single mode lookup."""
+
+    entity = _make_climate(
+        {
+            "name": "Zone",
+            "modes": "11101",
+            "mode": "1",
+            "power": "1",
+            "cold_consign": "24",
+            "availables_speeds": "3",
+            "cold_speed": "2",
+        },
+        heat_cool_opt_in=False,
+    )
+    monkeypatch.setattr(
+        AirzoneClimate.__mro__[1],
+        "async_write_ha_state",
+        lambda self: self._state_signature(),
+        raising=False,
+    )
+    lookups: list[int] = []
+    original = entity._backend_mode_code
+
+    def _counting_mode_code(*args: Any) -> str | None:
+        lookups.append(1)
+        return original(*args)
+
+    monkeypatch.setattr(entity, "_backend_mode_code", _counting_mode_code)
+
+    entity.async_write_ha_state()
+    assert len(lookups) == 1
+    assert entity.hvac_mode == HVACMode.COOL
+    assert len(lookups) == 2
+
+
+@pytest.mark.parametrize(
+    ("power", "expected"),
+    [
+        ("1", True),
+        (1, True),
+        (True, True),
+        (" ON ", True),
+        ("2", True),
+        ("0", False),
+        (0, False),
+        (False, False),
+        (None, False),
+        ("off", False),
+        ("garbage", False),
+        (["1"], False),
+    ],
+)
+def test_device_power_on_normalizes_backend_values(power: Any, expected: bool) -> None:
+    """Power values from the backend or overlays normalize to a bool."""
+
+    entity = _make_climate({"name": "Zone", "power": power}, heat_cool_opt_in=False)
+    assert entity._device_power_on() is expected
+
+
+def test_parse_float_accepts_numbers_and_decimal_strings() -> None:
+    """Setpoints may arrive as numbers or strings with either decimal mark."""
+
+    parse = AirzoneClimate._parse_float
+    assert parse(21.5) == 21.5
+    assert parse(21) == 21.0
+    assert parse("21.5") == 21.5
+    assert parse("21,5") == 21.5
+    assert parse(None) is None
+    assert parse(True) is None
+    assert parse("n/a") is None
+
+
+class RecordingApi:
+    """API stub that records /events payloads."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any]] = []
+
+    async def send_event(self, payload: dict[str, Any]) -> None:
+        event = payload["event"]
+        self.events.append((event["option"], event["value"]))
+
+
+def _make_writable_climate(
+    device_snapshot: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> tuple[AirzoneClimate, RecordingApi]:
+    """Build a climate entity wired for write paths (no real HA runtime)."""
+
+    entity = _make_climate(device_snapshot, heat_cool_opt_in=False)
+    api = RecordingApi()
+    entity.coordinator.api = api
+    entity.hass.loop = asyncio.get_running_loop()
+    monkeypatch.setattr(
+        climate_module_impl, "schedule_post_write_refresh", lambda *_a, **_k: None
+    )
+    monkeypatch.setattr(
+        AirzoneClimate.__mro__[1],
+        "async_write_ha_state",
+        lambda self: None,
+        raising=False,
+    )
+    return entity, api
+
+
+@pytest.mark.asyncio
+async def test_set_hvac_mode_from_off_sends_power_then_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """P1 must precede P2 when switching on into a mode."""
+
+    device = {"name": "Zone", "modes": "11101", "mode": "1", "power": "0"}
+    entity, api = _make_writable_climate(device, monkeypatch)
+
+    await entity.async_set_hvac_mode(HVACMode.HEAT)
+
+    assert api.events == [("P1", 1), ("P2", "2")]
+    assert entity.hvac_mode == HVACMode.HEAT
+
+
+@pytest.mark.asyncio
+async def test_set_hvac_mode_unsupported_fan_only_sends_nothing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Unsupported FAN_ONLY must not power the unit on as a side effect."""
+
+    device = {"name": "Zone", "modes": "11001", "mode": "1", "power": "0"}
+    entity, api = _make_writable_climate(device, monkeypatch)
+
+    await entity.async_set_hvac_mode(HVACMode.FAN_ONLY)
+
+    assert api.events == []
+
+
+@pytest.mark.asyncio
+async def test_set_temperature_and_fan_mode_skip_current_values(monkeypatch) -> None:
+    """Re-sending the current setpoint or fan speed must not hit the API."""
+
+    entity, api = _make_writable_climate(
+        {
+            "name": "Zone",
+            "modes": "11101",
+            "mode": "1",
+            "power": "1",
+            "cold_consign": "24.0",
+            "availables_speeds": "3",
+            "cold_speed": "2",
+        },
+        monkeypatch,
+    )
+
+    await entity.async_set_temperature(temperature=24)
+    await entity.async_set_fan_mode("medium")
+    assert api.events == []
+
+    await entity.async_set_temperature(temperature=23)
+    await entity.async_set_fan_mode("high")
+    assert api.events == [("P7", "23.0"), ("P3", "3")]
+
+
+@pytest.mark.asyncio
+async def test_set_hvac_mode_after_optimistic_off_powers_back_on(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """P1=1 is sent when the unit was just switched off, even if polls lag."""
+
+    device = {"name": "Zone", "modes": "11101", "mode": "1", "power": "1"}
+    entity, api = _make_writable_climate(device, monkeypatch)
+
+    await entity.async_set_hvac_mode(HVACMode.OFF)
+    await entity.async_set_hvac_mode(HVACMode.HEAT)
+    await entity.async_set_hvac_mode(HVACMode.COOL)
+
+    assert api.events == [("P1", 0), ("P1", 1), ("P2", "2"), ("P2", "1")]
+
+
+@pytest.mark.asyncio
+async def test_turn_on_off_skip_when_power_already_matches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """turn_on/turn_off only send P1 when the displayed power differs."""
+
+    device = {"name": "Zone", "modes": "11101", "mode": "1", "power": "1"}
+    entity, api = _make_writable_climate(device, monkeypatch)
+
+    await entity.async_turn_on()
+    assert api.events == []
+
+    await entity.async_turn_off()
+    await entity.async_turn_off()
+    assert api.events == [("P1", 0)]
+
+
+@pytest.mark.asyncio
+async def test_set_fan_mode_routes_fan_only_alias_to_heat_speed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """FAN_ONLY via P2=8 reads and writes the heat speed (P4)."""
+
+    device = {
+        "name": "Zone",
+        "modes": "00100001",
+        "mode": "8",
+        "power": "1",
+        "availables_speeds": "3",
+        "cold_speed": "1",
+        "heat_speed": "2",
+    }
+    entity, api = _make_writable_climate(device, monkeypatch)
+
+    assert entity.hvac_mode == HVACMode.FAN_ONLY
+    assert entity.fan_mode == "medium"
+
+    await entity.async_set_fan_mode("high")
+    assert api.events == [("P4", "3")]
+
+
+@pytest.mark.parametrize(
+    ("device_power", "skip_on", "skip_off"),
+    [
+        ({"power": "1"}, True, False),
+        ({"power": " ON "}, True, False),
+        ({"power": "0"}, False, True),
+        ({"power": "2"}, False, False),
+        ({"power": "yes"}, False, False),
+        ({"power": ""}, False, True),
+        ({}, False, True),
+    ],
+)
+def test_power_state_already_truth_table(
+    device_power: dict[str, Any], skip_on: bool, skip_off: bool
+) -> None:
+    """Only the exact on/off strings let turn_on/turn_off return early."""
+
+    entity = _make_climate(
+        {"name": "Zone", "modes": "11101", "mode": "1", **device_power},
+        heat_cool_opt_in=False,
+    )
+    assert entity._power_state_already(True) is skip_on
+    assert entity._power_state_already(False) is skip_off
+
+
+def test_preset_modes_are_not_shared_between_entities() -> None:
+    """Mutating one entity's preset list must not leak into another entity."""
+
+    device = {"name": "Zone", "modes": "11101", "mode": "1", "power": "1"}
+    first = _make_climate(dict(device), heat_cool_opt_in=False)
+    second = _make_climate(dict(device), heat_cool_opt_in=False)
+
+    first.preset_modes.append("boost")
+
+    assert second.preset_modes == ["home", "away", "sleep"]
@@ -221,8 +221,24 @@ def _install_homeassistant_stubs() -> None:
         pass
 
     core_module.HomeAssistant = HomeAssistant
+    core_module.callback = lambda func: func
     sys.modules["homeassistant.core"] = core_module
 
+    exceptions_module = sys.modules.setdefault(
+        "homeassistant.exceptions", types.ModuleType("homeassistant.exceptions")
+    )
+
+    class HomeAssistantError(Exception):  # pragma: no cover - stub only
+        pass
+
+    class ConfigEntryAuthFailed(HomeAssistantError):  # pragma: no cover - stub only
+        pass
+
+    if not hasattr(exceptions_module, "HomeAssistantError"):
+        exceptions_module.HomeAssistantError = HomeAssistantError
+    if not hasattr(exceptions_module, "ConfigEntryAuthFailed"):
+        exceptions_module.ConfigEntryAuthFailed = ConfigEntryAuthFailed
+
     data_entry_flow_module = types.ModuleType("homeassistant.data_entry_flow")
     data_entry_flow_module.FlowResultType = FlowResultType
     data_entry_flow_module.FlowResult = dict
@@ -277,6 +293,7 @@ def _install_homeassistant_stubs() -> None:
     ha_module.const = const_module
     ha_module.core = core_module
     ha_module.data_entry_flow = data_entry_flow_module
+    ha_module.exceptions = exceptions_module
     ha_module.helpers = helpers_module
 
 
@@ -303,6 +320,9 @@ from homeassistant.data_entry_flow import (  # type: ignore  # noqa: E402
     FlowResultType as HAFlowResultType,
 )
 
+from custom_components.airzoneclouddaikin import (  # noqa: E402
+    config_flow as config_flow_module,
+)
 from custom_components.airzoneclouddaikin.config_flow import (  # noqa: E402
     CONF_EXPOSE_PII,
     CONF_SCAN_INTERVAL,
@@ -332,7 +352,7 @@ def hass() -> HassStub:
 
 
 @pytest.fixture
-def api_mock() -> AsyncMock:
+def api_mock(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
     """Fixture that installs a stub AirzoneAPI returning a shared mock."""
 
     api_mock = AsyncMock()
@@ -340,14 +360,9 @@ def api_mock() -> AsyncMock:
     api_mock.token = "login-token"
     api_mock.clear_password = lambda: None
 
-    module_path = "custom_components.airzoneclouddaikin.airzone_api"
-    api_module = types.ModuleType(module_path)
-    api_module.AirzoneAPI = lambda *args, **kwargs: api_mock
-    sys.modules[module_path] = api_module
-
-    parent = sys.modules.get("custom_components.airzoneclouddaikin")
-    if parent is not None:
-        parent.airzone_api = api_module
+    monkeypatch.setattr(
+        config_flow_module, "AirzoneAPI", lambda *args, **kwargs: api_mock
+    )
 
     return api_mock
 
@@ -466,6 +481,63 @@ def test_reauth_flow_success_updates_token(hass: HassStub, api_mock: AsyncMock)
     assert entry.options[CONF_EXPOSE_PII] is False
 
 
+def test_reauth_flow_maps_login_timeout(hass: HassStub, api_mock: AsyncMock) -> None:
+    entry = ConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "user@example.com"},
+        options={"user_token": "old-token"},
+        unique_id="user@example.com",
+    )
+    entry.add_to_hass(hass)
+    api_mock.login = AsyncMock(side_effect=TimeoutError)
+
+    flow = AirzoneConfigFlow()
+    flow.hass = hass
+    flow.context = {"source": SOURCE_REAUTH, "entry_id": entry.entry_id}
+
+    result = _run(
+        flow.async_step_reauth_confirm(user_input={CONF_PASSWORD: "new-secret"})
+    )
+
+    assert result["type"] is HAFlowResultType.FORM
+    assert result["step_id"] == "reauth_confirm"
+    assert result["errors"] == {"base": "timeout"}
+    assert entry.options["user_token"] == "old-token"
+
+
+def test_reauth_flow_resolves_entry_once(
+    hass: HassStub, api_mock: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    entry = ConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "user@example.com"},
+        options={"user_token": "old-token"},
+        unique_id="user@example.com",
+    )
+    entry.add_to_hass(hass)
+
+    lookups: list[str] = []
+    original_get_entry = hass.config_entries.async_get_entry
+
+    def _counting_get_entry(entry_id: str) -> ConfigEntry | None:
+        lookups.append(entry_id)
+        return original_get_entry(entry_id)
+
+    monkeypatch.setattr(hass.config_entries, "async_get_entry", _counting_get_entry)
+
+    flow = AirzoneConfigFlow()
+    flow.hass = hass
+    flow.context = {"source": SOURCE_REAUTH, "entry_id": entry.entry_id}
+
+    _run(flow.async_step_reauth(entry.data))
+    result = _run(
+        flow.async_step_reauth_confirm(user_input={CONF_PASSWORD: "new-secret"})
+    )
+
+    assert result["reason"] == "reauth_successful"
+    assert lookups == [entry.entry_id]
+
+
 def test_options_flow_updates_options_and_preserves_hidden_keys(hass: HassStub) -> None:
     entry = ConfigEntry(
         domain=DOMAIN,
@@ -545,6 +617,25 @@ def test_options_flow_recomputes_heat_cool_when_cached_none(hass: HassStub) -> N
     assert hass.data[DOMAIN][entry.entry_id]["heat_cool_supported"] is True
 
 
+def test_options_flow_submit_coerces_stored_fallbacks(hass: HassStub) -> None:
+    entry = ConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "user@example.com"},
+        options={"user_token": "tok-123", CONF_SCAN_INTERVAL: "15"},
+        unique_id="user@example.com",
+    )
+    entry.add_to_hass(hass)
+
+    flow = AirzoneOptionsFlow(entry)
+    flow.hass = hass
+
+    result = _run(flow.async_step_init(user_input={}))
+
+    assert result["data"][CONF_SCAN_INTERVAL] == 15
+    assert result["data"][CONF_EXPOSE_PII] is False
+    assert result["data"]["user_token"] == "tok-123"
+
+
 def test_options_flow_defaults_sleep_timeout_when_missing(hass: HassStub) -> None:
     entry = ConfigEntry(
         domain=DOMAIN,
@@ -60,6 +60,8 @@ helpers_update_module.DataUpdateCoordinator = _DataUpdateCoordinator
 ha_module.helpers = helpers_module
 sys.modules.setdefault("homeassistant", ha_module)
 sys.modules.setdefault("homeassistant.core", core_module)
+if not hasattr(sys.modules["homeassistant.core"], "callback"):
+    sys.modules["homeassistant.core"].callback = lambda func: func
 helpers_module.event = helpers_event_module
 helpers_module.update_coordinator = helpers_update_module
 sys.modules.setdefault("homeassistant.helpers", helpers_module)
@@ -88,6 +90,8 @@ optimistic_get = helpers_module.optimistic_get
 optimistic_set = helpers_module.optimistic_set
 optimistic_invalidate = helpers_module.optimistic_invalidate
 async_auto_exit_sleep_if_needed = helpers_module.async_auto_exit_sleep_if_needed
+schedule_post_write_refresh = helpers_module.schedule_post_write_refresh
+parse_modes_bitmask = helpers_module.parse_modes_bitmask
 DOMAIN = helpers_module.DOMAIN
 
 
@@ -170,6 +174,16 @@ def test_optimistic_overlay_malformed_expiration(hass_stub: DummyHass) -> None:
     assert "device" not in optimistic_bucket
 
 
+def test_optimistic_get_without_overlay_leaves_data_untouched(
+    hass_stub: DummyHass,
+) -> None:
+    """Reads with no overlay should not create per-entry buckets."""
+
+    result = optimistic_get(hass_stub, "entry", "device", "temp", backend_value=20)
+    assert result == 20
+    assert hass_stub.data == {}
+
+
 class DummyApi:
     """Stub API to capture scenary writes."""
 
@@ -271,3 +285,41 @@ def test_auto_exit_sleep_skips_active_session(
     assert device_id not in optimistic_bucket
     assert "pending_refresh" not in hass_stub.data.get(DOMAIN, {}).get(entry_id, {})
     assert not scheduled
+
+
+def test_post_write_refresh_callback_runs_inline(
+    hass_stub: DummyHass, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The delayed refresh is a plain callback that clears its own handle."""
+
+    callbacks: list[Callable[[Any], None]] = []
+
+    def _schedule_stub(_hass: Any, _delay: float, cb: Any) -> Callable[[], None]:
+        callbacks.append(cb)
+        return lambda: None
+
+    created: list[Any] = []
+    hass_stub.async_create_task = created.append  # type: ignore[attr-defined]
+    monkeypatch.setattr(helpers_module, "async_call_later", _schedule_stub)
+
+    coordinator = DummyCoordinator(DummyApi())
+    cancel = schedule_post_write_refresh(hass_stub, coordinator, entry_id="entry")
+    bucket = hass_stub.data[DOMAIN]["entry"]
+    assert bucket["pending_refresh"] is cancel
+
+    result = callbacks[0](None)
+
+    assert result is None
+    assert len(created) == 1
+    assert bucket["pending_refresh"] is None
+    assert bucket["cancel_handles"] == []
+
+
+def test_parse_modes_bitmask_accepts_only_binary_strings() -> None:
+    """Only non-empty 0/1 strings survive; anything else becomes empty."""
+
+    assert parse_modes_bitmask("11101") == "11101"
+    assert parse_modes_bitmask(" 101 ") == "101"
+    assert parse_modes_bitmask("10a1") == ""
+    assert parse_modes_bitmask("1 0") == ""
+    assert parse_modes_bitmask(None) == ""
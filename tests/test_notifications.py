@@ -107,6 +107,14 @@ class HomeAssistant:  # pragma: no cover - placeholder
 
 
 core_module.HomeAssistant = HomeAssistant
+
+
+if not hasattr(core_module, "callback"):
+
+    def callback(func):
+        return func
+
+    core_module.callback = callback
 sys.modules["homeassistant.core"] = core_module
 ha_module.core = core_module
 
@@ -88,6 +88,8 @@ def _load_sensor_module_with_stubs() -> tuple[Any, Any]:
                 self.data: dict[str, Any] = {}
 
         core_module.HomeAssistant = HomeAssistant
+        if not hasattr(core_module, "callback"):
+            core_module.callback = lambda func: func
 
         components_module = sys.modules.setdefault(
             "homeassistant.components", types.ModuleType("homeassistant.components")
@@ -32,6 +32,14 @@ class HomeAssistant:  # pragma: no cover - type stub only
 
 core_module.HomeAssistant = HomeAssistant
 
+
+if not hasattr(core_module, "callback"):
+
+    def callback(func):
+        return func
+
+    core_module.callback = callback
+
 # Exceptions module (needed before importing switch)
 exceptions_module = sys.modules.setdefault(
     "homeassistant.exceptions", types.ModuleType("homeassistant.exceptions")